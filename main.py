@@ -1,6 +1,6 @@
 import sys
 
-from slnprojparse.parsing import _collect_sln_files, discover_solution_set, solution_set_to_json
+from slnprojparse.parsing import _collect_sln_files, _columnar_from_env, _write_json, discover_solution_set, solution_set_to_json
 import pathlib
 
 from slnprojparse.loghelper import log_debug
@@ -27,9 +27,9 @@ def parse_from_argv(argv):
         print(f"[INFO] No .sln files to process under {target}", file=sys.stderr)
         return 0
 
-    solution_set = discover_solution_set(target)
+    solution_set = discover_solution_set(target, sln_files=sln_files)
 
-    print(solution_set_to_json(solution_set))
+    _write_json(solution_set_to_json(solution_set, columnar=_columnar_from_env()))
 
     # Return 0 to indicate success
     return 0
@@ -50,8 +50,8 @@ def parse_from_target_path(target:pathlib.Path):
         print(f"[INFO] No .sln files to process under {target}", file=sys.stderr)
         return 0
 
-    solution_set = discover_solution_set(target)
-    print(solution_set_to_json(solution_set))
+    solution_set = discover_solution_set(target, sln_files=sln_files)
+    _write_json(solution_set_to_json(solution_set, columnar=_columnar_from_env()))
 
     # Return 0 to indicate success
     return 0
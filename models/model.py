@@ -1,13 +1,13 @@
 # file: model.py
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List
+from typing import TYPE_CHECKING, List
 
-import marshmallow
-import marshmallow_dataclass
-from marshmallow import fields
+if TYPE_CHECKING:
+    import marshmallow
 
 
 class Language(str, Enum):
@@ -29,7 +29,7 @@ class ProjectType(str, Enum):
     LEGPROJ = "Legace PROJ"
     # add more as needed
 
-@dataclass
+@dataclass(slots=True)
 class CodeFile:
     """A single source‑code file."""
     file_name: str #= field(metadata={"description": "Just the file name, e.g. Program.cs"})
@@ -37,7 +37,7 @@ class CodeFile:
     language: Language #= field(metadata={"description": "Language identifier, e.g. 'CS'"})
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """A project that contains many code files."""
     full_path: str # = field(metadata={"description": "Root folder of the project"})
@@ -49,7 +49,7 @@ class Project:
     #)
     child_projects: List[Project]
     
-@dataclass
+@dataclass(slots=True)
 class Solution:
     """Top‑level solution that groups projects."""
     full_path: str # = fields.Str(metadata={"description": "Root folder of the solution"})
@@ -58,7 +58,7 @@ class Solution:
    #     metadata={"description": "Projects contained in the solution"},
    # )
 
-@dataclass
+@dataclass(slots=True)
 class SolutionSet:
     """ Top‑level set of solutions based on given start path. """
     start_path: str #= fields.Str(metadata={"description": "Start folder of the solution search"})
@@ -67,9 +67,37 @@ class SolutionSet:
    # )
 # -------------------------------------------------------------------------
 # Automatically generate Marshmallow schemas from the dataclasses.
-# The generated classes are named <DataclassName>Schema.
-SolutionSchema = marshmallow_dataclass.class_schema(Solution)
-ProjectSchema = marshmallow_dataclass.class_schema(Project)
-CodeFileSchema = marshmallow_dataclass.class_schema(CodeFile)
-SolutionSetSchema = marshmallow_dataclass.class_schema(SolutionSet)
-# -------------------------------------------------------------------------
\ No newline at end of file
+# The generated classes are named <DataclassName>Schema.  They are built on
+# first access (PEP 562 module ``__getattr__``), so importing this module
+# does not pull in marshmallow unless a schema is actually used.
+_SCHEMA_DATACLASSES = {
+    "SolutionSchema": Solution,
+    "ProjectSchema": Project,
+    "CodeFileSchema": CodeFile,
+    "SolutionSetSchema": SolutionSet,
+}
+# -------------------------------------------------------------------------
+
+
+def __getattr__(name: str):
+    cls = _SCHEMA_DATACLASSES.get(name)
+    if cls is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import marshmallow_dataclass
+
+    schema = marshmallow_dataclass.class_schema(cls)
+    globals()[name] = schema  # later lookups skip __getattr__
+    return schema
+
+
+@functools.lru_cache(maxsize=None)
+def get_schema(cls: type) -> marshmallow.Schema:
+    """
+    Return one shared schema *instance* for the dataclass *cls*.
+
+    Building a schema instance walks all of its fields, so reuse this
+    instead of calling ``XxxSchema()`` for every dump/load.
+    """
+    import marshmallow_dataclass
+
+    return marshmallow_dataclass.class_schema(cls)()
@@ -31,66 +31,296 @@ import pathlib
 import re
 import sys
 import os
-import xml.etree.ElementTree as ET
-from typing import List, Dict, Set, Tuple
+import functools
+import json
+import mmap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from typing import Iterator, List, Dict, Set, Tuple
 from .loghelper import log_debug,log_info
-from models.model import Language,Solution,Project,CodeFile,SolutionSet,SolutionSchema,ProjectSchema,CodeFileSchema,SolutionSetSchema
+from models.model import Language,Solution,Project,CodeFile,SolutionSet
+
+# orjson is optional – without it the JSON export falls back to the stdlib.
+try:
+    import orjson
+except ImportError:  # pragma: no cover – depends on the environment
+    orjson = None
+
+# lxml (libxml2) is considerably faster at parsing and tag filtering; the standard
+# library parser remains the fallback so a plain Python install still works.
+try:
+    from lxml import etree as ET
+    _HAS_LXML = True
+except ImportError:  # pragma: no cover – depends on the environment
+    import xml.etree.ElementTree as ET
+    _HAS_LXML = False
 
 # ------------------------------------------------------------------
 # * Helpers that turn a plain‑text .sln file into a Solution object
 # ------------------------------------------------------------------
 
+# Project lines are rigidly formatted by Visual Studio:
+#     Project("{TYPE-GUID}") = "Name", "Relative\Path.csproj", "{GUID}"
+# so a literal prefix search plus split('"') finds them without a regex.
+_PROJECT_LINE_PREFIX = b'Project("{'
+_PROJECT_LINE_PREFIX_LEN = len(_PROJECT_LINE_PREFIX)
+_PROJECT_LINE_NL_PREFIX = b"\n" + _PROJECT_LINE_PREFIX
+
+# Set ``SLN_PARSE_REGEX=1`` to fall back to the (slower, but more lenient –
+# e.g. case‑insensitive) regex scanner below.
+_SLN_USE_REGEX = os.getenv("SLN_PARSE_REGEX", "").strip() not in ("", "0")
+
+# Compiled for *bytes* – the .sln is scanned straight out of an mmap, so only
+# the captured groups ever get decoded.  MULTILINE lets ``^`` anchor at each
+# line start; the classes exclude line breaks so a match never spans lines.
 _PROJECT_LINE_RE = re.compile(
-    r'''
-    ^Project\("\{[^}]+\}"\)      # literal Project("{GUID}")
-    \s*=\s*
-    "(?P<proj_name>[^"]+)"       # display name (may contain spaces)
-    \s*,\s*
-    "(?P<proj_path>[^"]+)"       # relative path to the .csproj/.vbproj …
-    \s*,\s*
-    "\{[^}]+\}"                  # the project GUID (ignored)
+    rb'''
+    ^Project\("\{[^}\r\n]+\}"\)    # literal Project("{GUID}")
+    [ \t]*=[ \t]*
+    "(?P<proj_name>[^"\r\n]+)"     # display name (may contain spaces)
+    [ \t]*,[ \t]*
+    "(?P<proj_path>[^"\r\n]+)"     # relative path to the .csproj/.vbproj ...
+    [ \t]*,[ \t]*
+    "\{[^}\r\n]+\}"                # the project GUID (ignored)
     ''',
-    re.IGNORECASE | re.VERBOSE,
+    re.IGNORECASE | re.VERBOSE | re.MULTILINE,
 )
 
+
+def _scan_sln(buf) -> Iterator[Tuple[str, str]]:
+    """
+    Yield ``(proj_name, proj_path)`` for every ``Project(...)`` line in
+    *buf* (the raw bytes of a ``.sln`` file, or an mmap of it).
+    """
+    if _SLN_USE_REGEX:
+        for m in _PROJECT_LINE_RE.finditer(buf):
+            yield m.group("proj_name").decode("utf-8"), m.group("proj_path").decode("utf-8")
+        return
+
+    find = buf.find
+    if buf[:_PROJECT_LINE_PREFIX_LEN] == _PROJECT_LINE_PREFIX:
+        line_start = 0
+    else:
+        line_start = find(_PROJECT_LINE_NL_PREFIX)
+        if line_start == -1:
+            return
+        line_start += 1
+    while True:
+        line_end = find(b"\n", line_start)
+        if line_end == -1:
+            line_end = len(buf)
+        # Project(  {TYPE-GUID}  ) =   Name  ,   Path  ,   {GUID}  …
+        # 0         1            2     3     4   5     6   7
+        parts = buf[line_start:line_end].split(b'"')
+        if len(parts) >= 8 and parts[3] and parts[5]:
+            yield parts[3].decode("utf-8"), parts[5].decode("utf-8")
+        line_start = find(_PROJECT_LINE_NL_PREFIX, line_end)
+        if line_start == -1:
+            return
+        line_start += 1
+
+
+def _read_sln_projects(sln_path: pathlib.Path) -> List[Tuple[str, str]]:
+    """
+    Return the ``(proj_name, proj_path)`` pairs listed in *sln_path*.
+
+    The file is memory‑mapped and scanned as bytes – no per‑line ``str``
+    objects and no decoding of the bulk of the file.
+    """
+    fd = os.open(str(sln_path), os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        if os.fstat(fd).st_size == 0:  # mmap refuses empty files
+            return []
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            return list(_scan_sln(mm))
+    finally:
+        os.close(fd)
+
+
+# ------------------------------------------------------------------
+# * Filesystem walk – os.scandir keeps the d_type from readdir(), so
+#   is_dir()/is_file() on a DirEntry normally costs no extra stat().
+# ------------------------------------------------------------------
+def _iter_files(root, suffixes: Tuple[str, ...]) -> Iterator[str]:
+    """
+    Yield the path (as ``str``) of every file below *root* whose name ends
+    with one of *suffixes* (compared case‑insensitively).
+
+    Like ``Path.rglob`` symlinked directories are not descended into, and
+    folders that cannot be listed are skipped silently.
+    """
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_files(entry.path, suffixes)
+                elif entry.is_file() and entry.name.lower().endswith(suffixes):
+                    yield entry.path
+    except OSError as exc:
+        log_debug(f"[WARN] Could not scan '{root}': {exc}")
+
+
 # ------------------------------------------------------------------
 # * Language detection – maps file‑extensions to the Language Enum
 # ------------------------------------------------------------------
-_EXTENSION_LANGUAGE_MAP = {
-    ".cs":   "CS",
-    ".fs":   "FS",
-    ".vb":   "VB",
-    ".py":   "PY",
-    ".java": "JAVA",
-    ".js":   "JS",
-   # ".csproj": "PROJECT",
-   # ".vbproj": "PROJECT"
+_EXTENSION_LANGUAGE_MAP: Dict[str, Language] = {
+    "cs":     Language.CSharp,
+    "fs":     Language.FSharp,
+    "vb":     Language.VB,
+    "py":     Language.Python,
+    "java":   Language.Java,
+    "js":     Language.JavaScript,
+    "csproj": Language.CSProject,
+    "vbproj": Language.VBProject,
     # add more extensions as you need them
 }
 
 
 def _detect_language(file_name: str) -> Language:
     """Very small heuristic based on file‑extension."""
-    ext = os.path.splitext(file_name)[1].lower()
-    return {
-        ".cs": Language.CSharp,
-        ".fs": Language.FSharp,
-        ".vb": Language.VB,
-        ".py": Language.Python,
-        ".java": Language.Java,
-        ".js": Language.JavaScript,
-        ".csproj": Language.CSProject,
-        ".vbproj": Language.VBProject,
-    }.get(ext, Language.Empty)   # fallback – you can change it
+    _, dot, ext = file_name.rpartition(".")
+    if not dot:
+        return Language.Empty
+    # Unknown extensions fall back to Language.Empty – you can change it.
+    return _EXTENSION_LANGUAGE_MAP.get(ext.lower(), Language.Empty)
+
+
+# ------------------------------------------------------------------
+# * MSBuild item tags – legacy projects use the 2003 namespace, SDK‑style
+#   projects have none.  Built once here instead of per project file.
+# ------------------------------------------------------------------
+_MSB_NS = "http://schemas.microsoft.com/developer/msbuild/2003"
+_COMPILE_TAG_NS = f"{{{_MSB_NS}}}Compile"
+_COMPILE_TAG_NONS = "Compile"
+_PROJREF_TAG_NS = f"{{{_MSB_NS}}}ProjectReference"
+_PROJREF_TAG_NONS = "ProjectReference"
+_COMPILE_TAGS = frozenset((_COMPILE_TAG_NS, _COMPILE_TAG_NONS))
+_PROJREF_TAGS = frozenset((_PROJREF_TAG_NS, _PROJREF_TAG_NONS))
+_ITEM_TAGS = (_COMPILE_TAG_NS, _COMPILE_TAG_NONS, _PROJREF_TAG_NS, _PROJREF_TAG_NONS)
+
+
+def _read_project_items(proj_file: str) -> Tuple[Dict[str, str], List[str], List[str]]:
+    """
+    Stream *proj_file* and return ``(root_attrib, compile_includes,
+    reference_includes)``.
+
+    Only ``<Compile>`` and ``<ProjectReference>`` elements are inspected and
+    each one is released as soon as its ``Include`` has been read, so the
+    full DOM of a big project file is never held in memory.
+    """
+    compile_includes: List[str] = []
+    reference_includes: List[str] = []
+    if _HAS_LXML:
+        # libxml2 filters the tags itself – nothing else reaches Python.
+        context = ET.iterparse(proj_file, events=("end",), tag=_ITEM_TAGS)
+    else:
+        context = ET.iterparse(proj_file, events=("end",))
+
+    for _, elem in context:
+        tag = elem.tag
+        if tag in _COMPILE_TAGS:
+            inc = elem.get("Include")
+            if inc:
+                compile_includes.append(inc)
+        elif tag in _PROJREF_TAGS:
+            inc = elem.get("Include")
+            if inc is not None:
+                reference_includes.append(inc)
+        else:
+            continue
+        elem.clear()
+        if _HAS_LXML:
+            # Also drop the already‑processed siblings from the parent.
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+    return dict(context.root.attrib), compile_includes, reference_includes
+
+
+# ------------------------------------------------------------------
+# * Per‑file results of parse_proj, shared by every solution of one
+#   discover_solution_set run.  Keyed by the resolved project path; the
+#   dict lives only as long as that run, so edits made in between runs
+#   (new source files, changed project files) are always picked up.
+# ------------------------------------------------------------------
+_ProjectCache = Dict[str, Tuple[List[CodeFile], List[str], List[str]]]
+_PROJECT_CACHE_LOCK = threading.Lock()
+
+
+def _load_project_file(
+    proj_str: str, project_cache: _ProjectCache | None = None
+) -> Tuple[List[CodeFile], List[str], List[str]]:
+    """
+    Read the resolved project file *proj_str* and return ``(code_files,
+    nested_project_files, reference_includes)``.
+
+    This is the expensive, context‑free part of :func:`parse_proj` (XML plus
+    filesystem walks).  When a *project_cache* is given the result is
+    memoised in it, so a shared library referenced from many solutions is
+    only read once per run.  The returned lists may belong to the cache –
+    copy them before handing them out.
+    """
+    if project_cache is not None:
+        with _PROJECT_CACHE_LOCK:
+            cached = project_cache.get(proj_str)
+        if cached is not None:
+            return cached
+
+    proj_dir = os.path.dirname(proj_str)
+
+    # ------------------------------------------------------------------
+    # * Stream the XML – namespaced (legacy) and plain (SDK) tags both match
+    # ------------------------------------------------------------------
+    root_attrib, compile_includes, reference_includes = _read_project_items(proj_str)
+
+    # ------------------------------------------------------------------
+    # * Gather source files (<Compile Include="…"/> etc.)
+    # ------------------------------------------------------------------
+    code_files: List[CodeFile] = []
+    nested_project_files: List[str] = []
+    for inc in compile_includes:
+        src_path = os.path.normpath(os.path.join(proj_dir, inc))
+        if os.path.isfile(src_path):
+            file_name = os.path.basename(src_path)
+            _language = _detect_language(file_name)
+            if _language is Language.CSharp or _language is Language.VB:
+                cf = CodeFile(
+                    file_name=file_name,
+                    full_path=src_path,
+                    language=_language,
+                )
+                code_files.append(cf)
+            elif _language is Language.CSProject or _language is Language.VBProject:
+                nested_project_files.append(src_path)
+
+    project_type="UNKNOWN"
+    if "Sdk" in root_attrib:
+        if root_attrib["Sdk"] is not None:
+            if root_attrib["Sdk"]== "Microsoft.NET.Sdk":
+                project_type="dotNET_SDK"
+    if len(code_files) < 1 and project_type=="dotNET_SDK":
+        code_files=_get_sdk_files(project_type,proj_dir)
+
+    result = (code_files, nested_project_files, reference_includes)
+    if project_cache is not None:
+        with _PROJECT_CACHE_LOCK:
+            project_cache[proj_str] = result
+    return result
 
 
 def parse_proj(
-    proj_path: pathlib.Path,
-    visited: Set[pathlib.Path] | None = None,
+    proj_path: str | os.PathLike,
+    visited: Set[str] | None = None,
+    project_cache: _ProjectCache | None = None,
 ) -> Tuple[Project, List[Project]]:
     """
     Parse a single *.proj* (csproj, vbproj, …) file.
 
+    *project_cache* is an optional dict shared between calls (see
+    ``discover_solution_set``) so each project file is only read once.
+
     Returns
     -------
     Tuple[Project, List[Project]]
@@ -102,168 +332,90 @@ def parse_proj(
     """
     if visited is None:
         visited = set()
-    proj_path=str(proj_path).replace("\\","/")
-    proj_path=pathlib.Path(proj_path)
-    proj_path = proj_path.resolve()
-    if not proj_path.is_file():
-        raise FileNotFoundError(f"Project file not found: {proj_path}")
-
-    # ------------------------------------------------------------------
-    # * Load the XML (keep namespace because the schema uses it)
-    # ------------------------------------------------------------------
-    tree = ET.parse(str(proj_path))
-    root = tree.getroot()
-
-    # ------------------------------------------------------------------
-    # * Determine default namespace (MSBuild uses http://schemas.microsoft.com/developer/msbuild/2003)
-    # ------------------------------------------------------------------
-    ns_prefix = ""
-    ns_map = {}
-    if root.tag.startswith("{"):
-        ns_uri = root.tag.split("}")[0].strip("{")
-        ns_prefix = f"{{{ns_uri}}}"
-        ns_map = {"msb": ns_uri}
+    # Resolve once – everything below works on these absolute strings.
+    proj_str = os.path.realpath(os.fspath(proj_path).replace("\\","/"))
+    proj_dir = os.path.dirname(proj_str)
+    if not os.path.isfile(proj_str):
+        raise FileNotFoundError(f"Project file not found: {proj_str}")
+
+    code_files, nested_project_files, reference_includes = _load_project_file(
+        proj_str, project_cache
+    )
 
     # ------------------------------------------------------------------
-    # * Gather source files (<Compile Include="…"/> etc.)
+    # * Project files that are listed as <Compile> items
     # ------------------------------------------------------------------
-    code_files: List[CodeFile] = []
     child_projects: List[Project] = []
-    for item in root.findall(f".//{ns_prefix}Compile"):
-        inc = item.attrib.get("Include")
-        if not inc:
+    for src_path in nested_project_files:
+        child_path = os.path.realpath(src_path)
+        # Same circular‑reference guard as for ProjectReference below.
+        if child_path in visited:
             continue
-        src_path = (proj_path.parent / inc).resolve()
-        if src_path.is_file():
-            _language = _detect_language(src_path.name)
-            if _language is Language.CSharp or _language is Language.VB:
-                cf = CodeFile(
-                    file_name=os.path.basename(src_path),
-                    full_path=str(src_path),
-                    language=_detect_language(src_path.name),
-                )
-                code_files.append(cf)
-            if _language is Language.CSProject or _language is Language.VBProject:
-                prj = Project(
-                    file_name=os.path.basename(src_path),
-                    full_path=str(src_path), 
-                )
-                child_projects.append(_process_child_project(prj))
+        visited.add(child_path)
+        child_proj, _ = parse_proj(child_path, visited=visited, project_cache=project_cache)
+        child_projects.append(child_proj)
 
     # ------------------------------------------------------------------
     # * Discover child projects (ProjectReference)
     # ------------------------------------------------------------------
     
-    for ref in root.findall(f".//{ns_prefix}ProjectReference"):
-        if 'Include' in ref.attrib:
-            child_path = (proj_path.parent / ref.attrib["Include"]).resolve()
-            # Guard against circular references – we simply ignore already‑visited ones.
-            if child_path in visited:
-                continue
-            visited.add(child_path)
-            child_proj, grandchildren = parse_proj(child_path, visited=visited)
-            # Nest grandchildren under the child we just created
-            child_proj.child_projects.extend(grandchildren)
-            child_projects.append(child_proj)
+    for inc in reference_includes:
+        child_path = os.path.realpath(os.path.join(proj_dir, inc))
+        # Guard against circular references – we simply ignore already‑visited ones.
+        if child_path in visited:
+            continue
+        visited.add(child_path)
+        child_proj, grandchildren = parse_proj(
+            child_path, visited=visited, project_cache=project_cache
+        )
+        # Nest grandchildren under the child we just created
+        child_proj.child_projects.extend(grandchildren)
+        child_projects.append(child_proj)
 
     # ------------------------------------------------------------------
     # * Build the Project dataclass
     # ------------------------------------------------------------------
-    project_type="UNKNOWN"
-    if "Sdk" in root.attrib:
-        if root.attrib["Sdk"] is not None:
-            if root.attrib["Sdk"]== "Microsoft.NET.Sdk":
-                project_type="dotNET_SDK"
-    collected_source_files =  code_files #_collect_source_files(root, ns_prefix, proj_path.parent)
-    if len(collected_source_files) < 1 and project_type=="dotNET_SDK":
-        collected_source_files=_get_sdk_files(project_type,proj_path.parent)
-    proj_file_name = proj_path.name
-    proj_folder_path = str(proj_path.parent.resolve())
-    proj_full_path = str(proj_path.parent.resolve())
-    proj_full_path += "/"
-    proj_full_path += proj_file_name
     project = Project(
-        full_path=str(proj_full_path),
-        project_folder_path=str(proj_folder_path),
-        name=proj_path.stem,
-        code_files=collected_source_files,
+        full_path=proj_str,
+        project_folder_path=proj_dir,
+        name=os.path.splitext(os.path.basename(proj_str))[0],
+        code_files=list(code_files),
         child_projects=child_projects,
     )
     return project, child_projects
 
-def  _get_sdk_files(project_Type:str, proj_path:pathlib.Path) ->List[pathlib.Path]:
-    codeList:List[pathlib.Path] = []
-
-    for cs_file in proj_path.rglob("*.cs"):
-        codeList.append(cs_file.resolve())
-    for vb_file in proj_path.rglob("*.vb"):
-        codeList.append(vb_file.resolve())
-
+def  _get_sdk_files(project_Type:str, proj_path:str) ->List[CodeFile]:
+    # One walk for both languages – *proj_path* is already resolved, so the
+    # joined entry paths are absolute without a per-file resolve().
     code_files= [
             CodeFile(
                 file_name=os.path.basename(cf_path),
-                full_path=str(cf_path),
-                language=_detect_language(cf_path.name),
+                full_path=cf_path,
+                language=_detect_language(cf_path),
             )
-            for cf_path in codeList
+            for cf_path in _iter_files(proj_path, (".cs", ".vb"))
     ]
     return code_files
 
-# ------------------------------------------------------------------
-# * Parse a single project file (csproj, vbproj, …) → Project dataclass
-# ------------------------------------------------------------------
-def _parse_project_file(proj_path: pathlib.Path) -> Project:
-    """
-    Build a :class:`Project` instance for *proj_path*.
-
-    The function re‑uses the existing ``parse_proj`` logic that extracts
-    every <Compile Include="…"/> element and enriches the result with a
-    language identifier.
-    """
-
-    # The *name* of the project is the file‑stem (MyApp.csproj → MyApp)
-    name = proj_path.stem
-    proj_file_name = proj_path.name
-    # Use the original ``parse_proj`` implementation to collect raw
-    # dictionaries (filename + absolute path) for every <Compile> element.
-    rootProj,childProj = parse_proj(proj_path)          # <-- the original helper from the script
-    code_files=rootProj.code_files
-    child_projects = [_process_child_project(p) for p in childProj]
-    log_debug("::code_files::",code_files)
-    proj_folder_path = str(proj_path.parent.resolve())
-    proj_full_path = str(proj_path.parent.resolve())
-    proj_full_path += "/"
-    proj_full_path += proj_file_name
-    return Project(
-        full_path=str(proj_full_path),
-        project_folder_path=str(str(proj_folder_path)),
-        name=name,
-        code_files=code_files, child_projects=child_projects
-    )
-
-def _process_child_project(child_project:Project) -> Project:
-    log_debug("::child_project::",child_project)
-    child_project_folder_path = pathlib.Path(child_project.full_path).parent.resolve()
-    child_project.project_folder_path = str(child_project_folder_path)
-    return child_project
-     
 # ------------------------------------------------------------------
 # * Parse a .sln file → Solution dataclass (populated with Projects)
 # ------------------------------------------------------------------
-def _parse_solution_file(sln_path: pathlib.Path) -> Solution:
+def _parse_solution_file(
+    sln_path: pathlib.Path, project_cache: _ProjectCache | None = None
+) -> Solution:
     """
     Turn a plain‑text ``*.sln`` file into a :class:`Solution` instance.
 
     * All project paths referenced in the file are resolved to absolute
       paths.
-    * For each project we call ``_parse_project_file`` to collect its
-      source files.
+    * For each project we call ``parse_proj`` to collect its source files
+      and child projects.
     * The resulting ``Solution`` contains a list of fully‑populated
       :class:`Project` objects.
     """
 
     solution_name = sln_path.name
-    solution_root = str(sln_path.parent.resolve())
+    solution_root = os.path.realpath(os.path.dirname(sln_path))
 
     solution = Solution(
         full_path=solution_root,
@@ -271,24 +423,19 @@ def _parse_solution_file(sln_path: pathlib.Path) -> Solution:
         projects=[],
     )
 
-    # Walk the solution line‑by‑line and extract every project reference.
+    # Extract every project reference from the solution.
     try:
-        with sln_path.open(encoding="utf-8") as fh:
-            for line in fh:
-                m = _PROJECT_LINE_RE.match(line)
-                if not m:
-                    continue
-
-                proj_path = pathlib.Path(m.group("proj_path").replace("\\","/"))
-                sProj_path = str(proj_path)
-                #Check to make sure the ref is to a supported type
-                if '.csproj' in sProj_path.lower() or '.vbproj' in sProj_path:
-                    # The path stored in the .sln is relative to the .sln location.
-                    abs_proj_path = (sln_path.parent / proj_path).resolve()
-                
-                    # Build a Project object (including its code files)
-                    project = _parse_project_file(abs_proj_path)
-                    solution.projects.append(project)
+        for _proj_name, raw_proj_path in _read_sln_projects(sln_path):
+            sProj_path = raw_proj_path.replace("\\","/")
+            #Check to make sure the ref is to a supported type
+            if '.csproj' in sProj_path.lower() or '.vbproj' in sProj_path:
+                # The path stored in the .sln is relative to the .sln location;
+                # parse_proj resolves it.
+                abs_proj_path = os.path.join(solution_root, sProj_path)
+            
+                # Build a Project object (including its code files)
+                project, _ = parse_proj(abs_proj_path, project_cache=project_cache)
+                solution.projects.append(project)
 
     except (OSError, UnicodeDecodeError) as exc:
         log_debug(f"[ERROR] Could not read solution '{sln_path}': {exc}", file=sys.stderr)
@@ -296,53 +443,152 @@ def _parse_solution_file(sln_path: pathlib.Path) -> Solution:
     return solution
 
 
+def _worker_count() -> int:
+    """Number of CPUs this process may actually run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on Windows / macOS
+        return os.cpu_count() or 1
+
+
 # ------------------------------------------------------------------
 # * Public entry‑point – discover every solution under *start_path*
 # ------------------------------------------------------------------
-def discover_solution_set(start_path: pathlib.Path) -> SolutionSet:
+def discover_solution_set(
+    start_path: pathlib.Path,
+    sln_files: List[pathlib.Path] | None = None,
+) -> SolutionSet:
     """
     Scan *start_path* (recursively) for ``*.sln`` files and return a
     :class:`SolutionSet` that contains fully‑populated :class:`Solution`
     objects.
 
     The function is the only thing you need to call from user code – it
-    returns the top‑level container you asked for.
+    returns the top‑level container you asked for.  Pass *sln_files* (e.g.
+    from ``_collect_sln_files``) when the tree has already been scanned, so
+    it is not walked a second time.
     """
 
     start_path = start_path.resolve()
     log_debug(":: start_path ::", start_path)
     solution_set = SolutionSet(start_path=str(start_path.absolute()), solutions=[])
 
-    for sln_file in start_path.rglob("*.sln"):
-        solution = _parse_solution_file(sln_file)
-        solution_set.solutions.append(solution)
+    if sln_files is None:
+        sln_files = [pathlib.Path(p) for p in _iter_files(start_path, (".sln",))]
+
+    # Solutions are independent of each other and the work is mostly file
+    # I/O plus expat, which both release the GIL – so threads pay off.
+    # ``map`` keeps the results in discovery order.  The project cache is
+    # scoped to this run, so repeated calls always see the current tree.
+    parse_solution = functools.partial(_parse_solution_file, project_cache={})
+    with ThreadPoolExecutor(max_workers=_worker_count()) as executor:
+        solution_set.solutions.extend(executor.map(parse_solution, sln_files))
 
     return solution_set
 
 
 # ------------------------------------------------------------------
-# * Optional: Serialisation to JSON using the generated Marshmallow
-#      schemas (just a convenience – not required for the core task)
+# * Optional: Serialisation to JSON (just a convenience – not required
+#      for the core task)
 # ------------------------------------------------------------------
-def solution_set_to_json(solution_set: SolutionSet) -> str:
+
+# Field names per dataclass, so ``fields()`` is only reflected once per class.
+_DATACLASS_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
+
+def _code_files_to_columns(code_files: List[CodeFile]) -> Dict[str, List[str]]:
+    """``[CodeFile, …]`` → ``{"file_names": […], "full_paths": […], "languages": […]}``."""
+    return {
+        "file_names": [cf.file_name for cf in code_files],
+        "full_paths": [cf.full_path for cf in code_files],
+        "languages": [cf.language.name for cf in code_files],
+    }
+
+
+def _to_plain(obj, columnar: bool = False):
+    """
+    Turn the model dataclasses into plain dicts / lists / strings.
+
+    Enums are written by *name* (``"CSharp"``), which is what the
+    marshmallow schemas produced.  With *columnar* each project's code
+    files become parallel arrays (see ``_code_files_to_columns``).
+    """
+    cls = type(obj)
+    if cls is str:
+        return obj
+    names = _DATACLASS_FIELDS.get(cls)
+    if names is None and is_dataclass(cls):
+        names = _DATACLASS_FIELDS[cls] = tuple(f.name for f in fields(cls))
+    if names is not None:
+        if columnar and cls is Project:
+            return {
+                name: (
+                    _code_files_to_columns(obj.code_files)
+                    if name == "code_files"
+                    else _to_plain(getattr(obj, name), columnar)
+                )
+                for name in names
+            }
+        return {name: _to_plain(getattr(obj, name), columnar) for name in names}
+    if isinstance(obj, Enum):
+        return obj.name
+    if isinstance(obj, list):
+        return [_to_plain(item, columnar) for item in obj]
+    return obj
+
+
+def solution_set_to_json(solution_set: SolutionSet, columnar: bool = False) -> str:
     """
     Serialise a :class:`SolutionSet` to a pretty‑printed JSON string.
+
+    With ``columnar=True`` every ``code_files`` entry is written as three
+    parallel arrays (``file_names``, ``full_paths``, ``languages``) rather
+    than a list of objects – smaller and faster on big projects.
     """
-    schema = SolutionSetSchema()
-    return schema.dumps(solution_set, indent=2)
+    plain = _to_plain(solution_set, columnar)
+    if orjson is not None:
+        return orjson.dumps(plain, option=orjson.OPT_INDENT_2).decode()
+    # orjson has no ASCII‑escaping mode, so the fallback writes raw
+    # characters too – both backends produce identical output.
+    return json.dumps(plain, indent=2, ensure_ascii=False)
 
 # ---------------------------------------------------------------------------
 #  Command‑line interface
 # ---------------------------------------------------------------------------
 
+def _columnar_from_env() -> bool:
+    """CLI default for ``solution_set_to_json(columnar=…)``: ``SLN_OUTPUT_MODE=soa``."""
+    return os.getenv("SLN_OUTPUT_MODE", "").strip().lower() == "soa"
+
+
+def _write_json(text: str) -> None:
+    """
+    Write *text* (e.g. from ``solution_set_to_json``) to STDOUT as UTF‑8.
+
+    ``print`` would encode with the console code page (cp1252 on many
+    Windows setups) and fail on file names it cannot represent.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:  # stdout replaced by a text‑only stream
+        print(text)
+        return
+    sys.stdout.flush()
+    buffer.write(text.encode("utf-8") + b"\n")
+    buffer.flush()
+
+
 def _collect_sln_files(target: pathlib.Path) -> List[pathlib.Path]:
-    """Return a list of *.sln* files under *target* (file or directory)."""
+    """
+    Return a list of *.sln* files under *target* (file or directory), in
+    discovery order – hand it to ``discover_solution_set(sln_files=…)``.
+    """
     if target.is_file() and target.suffix.lower() == ".sln":
         return [target]
     elif target.is_dir():
         log_debug("::target::",target)
-        log_debug(sorted(target.rglob("*.sln")))
-        return sorted(target.rglob("*.sln"))
+        sln_files = [pathlib.Path(p) for p in _iter_files(target, (".sln",))]
+        log_debug(sln_files)
+        return sln_files
     else:
         log_debug(f"[WARN] No .sln file found at {target}", file=sys.stderr)
         return []